@@ -1,15 +1,15 @@
 # This file includes classes used for the chess game implementation:
 # Parent class ChessPiece and its child classes Pawn, Knight, Bishop, Rook,
-# Queen, King, Falcon, and Hunter
+# Queen, King, and FairyPiece with its child classes Falcon and Hunter
 # Board, Player, and Chess classes
 
+import sys
+from array import array
 from abc import ABC, abstractmethod
 from collections.abc import Collection
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Optional
 
-import numpy as np
-
 
 class Color(Enum):
     """Enumeration representing valid chess piece colors."""
@@ -17,11 +17,63 @@ class Color(Enum):
     WHITE = 2
 
 
-class GameState(Enum):
-    """Enumeration representing game states."""
-    UNFINISHED = 1
-    BLACK_WON = 2
-    WHITE_WON = 3
+class GameState(IntEnum):
+    """
+    Enumeration representing game states.
+    UNFINISHED is 0 so that a finished game is the only truthy state.
+    """
+    UNFINISHED = 0
+    BLACK_WON = 1
+    WHITE_WON = 2
+
+
+class MoveError(Enum):
+    """
+    Enumeration of the reasons why a proposed move or fairy piece entry is illegal.
+    Each value is the message shown to the player when the move is rejected.
+    """
+    PAWN_FIRST_MOVE_TOO_FAR = "Pawns cannot move more than 2 spaces forward on their first turn!"
+    PAWN_JUMP = "Pawns cannot jump over other pieces."
+    PAWN_BACKWARDS = "Pawns cannot move backwards!"
+    PAWN_SIDEWAYS = "Pawns cannot move sideways!"
+    PAWN_TOO_FAR = "Pawns cannot move more than 1 space forward after their first turn!"
+    PAWN_STRAIGHT_CAPTURE = "Pawns cannot capture by moving straight forward."
+    PAWN_DIAGONAL_TOO_FAR = "Pawns cannot move more than one square diagonally."
+    PAWN_DIAGONAL_TO_EMPTY = "Pawns cannot move diagonally to an empty square."
+    KNIGHT_SHAPE = "The knight can only move in a 2+1 or 1+2 L shape!"
+    BISHOP_SHAPE = "Bishops can only move diagonally!"
+    BISHOP_JUMP = "Bishops cannot jump over other pieces!"
+    ROOK_SHAPE = "Rooks can only move horizontally or vertically!"
+    ROOK_JUMP = "Rooks cannot jump over other pieces!"
+    QUEEN_SHAPE = "A queen can only move diagonally, or straight up, down, left or right!"
+    QUEEN_JUMP = "A queen cannot jump over other pieces!"
+    KING_SHAPE = "A king can only move one square in any direction!"
+    FALCON_SIDEWAYS = "Falcons cannot move straight left or right!"
+    FALCON_BACKWARD = "Falcons can only move straight backwards!"
+    FALCON_FORWARD = "Falcons can only move diagonally forward!"
+    FALCON_JUMP = "A falcon cannot jump over other pieces!"
+    HUNTER_SIDEWAYS = "Hunters cannot move straight left or right!"
+    HUNTER_FORWARD = "Hunters can only move straight forward!"
+    HUNTER_BACKWARD = "Hunters can only move diagonally backward!"
+    HUNTER_JUMP = "A hunter cannot jump over other pieces!"
+    GAME_OVER = "The game is over! No more moves can be made!"
+    INVALID_SQUARES = "Start and goal square must be two different squares on the board. Move cannot be completed."
+    EMPTY_START_SQUARE = "The specified start square does not contain a chess piece. Move cannot be completed."
+    WRONG_TURN = "It's the other player's turn. Move cannot be completed."
+    OWN_PIECE_ON_GOAL = "The goal square already contains a piece from the current player. Move cannot be completed."
+    FAIRY_GAME_OVER = "The game is over! No more fairy pieces can be entered!"
+    NO_MAJOR_PIECE_LOST = "This player cannot enter a fairy piece since they have not lost any major pieces yet!"
+    NO_SECOND_MAJOR_PIECE_LOST = ("This player cannot enter a second fairy piece since they have not lost a second "
+                                  "major piece yet!")
+    FAIRY_SQUARE_OFF_BOARD = "The specified square is not on the board. The fairy piece cannot be entered there."
+    FAIRY_SQUARE_OCCUPIED = ("The specified square already contains a chess piece. The fairy piece cannot be entered "
+                             "there.")
+    WHITE_OUTSIDE_HOME_RANKS = "White cannot enter a piece outside of row 1 or row 2!"
+    WHITE_ENTERS_BLACK_PIECE = "White cannot enter a black fairy piece!"
+    BLACK_OUTSIDE_HOME_RANKS = "Black cannot enter a piece outside of row 7 or row 8!"
+    BLACK_ENTERS_WHITE_PIECE = "Black cannot enter a white fairy piece!"
+    NO_FAIRY_PIECES_LEFT = "Sorry! This player doesn't have any fairy pieces left!"
+    FAIRY_PIECE_UNAVAILABLE = "The current player does not have this type of fairy piece available anymore!"
 
 
 # Future work to make it easy to add a GUI:
@@ -41,19 +93,26 @@ class ChessPiece(ABC):
     Has various child classes for each type of chess piece.
     """
 
-    def __init__(self, color: Color, label: str) -> None:
+    # Pieces only ever hold these attributes, so they don't need a per-instance __dict__
+    __slots__ = ('_color', '_is_white', '_label')
+    # Label of the piece type as a lowercase character, defined by each child class
+    _base_label: str
+
+    def __init__(self, color: Color) -> None:
         """
-        Creates a new ChessPiece object with the specified color and label.
+        Creates a new ChessPiece object with the specified color and the label of its piece type.
         :param color: piece color as a Color enumeration member
-        :param label: piece label as a lowercase character
         """
         self._color = color
 
+        # Cache whether the piece is white so that move checks read a bool instead of comparing enum members
+        self._is_white = color is Color.WHITE
+
         # If the piece is white, we change the label to an uppercase char
-        if color == Color.WHITE:
-            self._label = label.upper()
+        if self._is_white:
+            self._label = self._base_label.upper()
         else:
-            self._label = label
+            self._label = self._base_label
 
     def get_color(self) -> Color:
         """
@@ -69,27 +128,45 @@ class ChessPiece(ABC):
         """
         return self._label
 
-    def handle_move(self, start_square: np.array, goal_square: np.array) -> None:
+    def get_label_lower(self) -> str:
         """
-        Reacts to the piece being moved from the given start square to the given goal square.
-        :param start_square: the start position as a vector [row, column]
-        :param goal_square: the goal position as a vector [row, column]
-        :return: No return value
+        Returns the label of the chess piece's type regardless of its color.
+        :return: Label as a lowercase char
         """
-        pass
+        return self._base_label
 
-    @abstractmethod
-    def move_legal(self, start_square: np.array, goal_square: np.array, board: "Board") -> bool:
+    def __reduce__(self) -> str:
+        """
+        Makes copied and pickled games refer to the shared module-level piece objects instead of duplicating them,
+        since board codes and fairy piece lookups depend on the piece objects being the same.
+        :return: name of the module-level piece object as a string, for example 'WHITE_PAWN'
+        """
+        return f"{self._color.name}_{type(self).__name__.upper()}"
+
+    def move_legal(self, start_square: tuple[int, int], goal_square: tuple[int, int], board: "Board") -> bool:
         """
         Check if a proposed move is legal according to the piece's moveset and current state of the game board.
-        Overridden in child classes.
-        :param start_square: the start position as a vector [row, column]
-        :param goal_square: the goal position as a vector [row, column]
+        :param start_square: the start position as a tuple (row, column)
+        :param goal_square: the goal position as a tuple (row, column)
         :param board: the game's board as a Board object
         :return:    Boolean:
                     False if move is illegal
                     True if move is legal
         """
+        return self.get_move_error(start_square, goal_square, board) is None
+
+    @abstractmethod
+    def get_move_error(self, start_square: tuple[int, int], goal_square: tuple[int, int],
+                       board: "Board") -> Optional[MoveError]:
+        """
+        Check if a proposed move is legal according to the piece's moveset and current state of the game board.
+        Does not print anything, so it is cheap to call for moves that turn out to be illegal.
+        Overridden in child classes.
+        :param start_square: the start position as a tuple (row, column)
+        :param goal_square: the goal position as a tuple (row, column)
+        :param board: the game's board as a Board object
+        :return: None if the move is legal, otherwise the reason why it is illegal as a MoveError enumeration member
+        """
         pass
 
 
@@ -101,83 +178,129 @@ class Pawn(ChessPiece):
     Inherits from ChessPiece.
     Communicates with the Board class to check for opposing chess pieces in diagonal forward directions.
     """
+    __slots__ = ('_starting_row_offset', '_forward_step')
+    _base_label = 'p'
+    # Legal pawn moves as (rows forward, columns to the side): straight moves before and after the first move, which
+    # need empty squares, and diagonal moves, which need a piece to capture
+    _first_move_steps = frozenset({(1, 0), (2, 0)})
+    _steps = frozenset({(1, 0)})
+    _capture_steps = frozenset({(1, -1), (1, 1)})
 
     def __init__(self, color: Color) -> None:
         """
-        Creates a new Pawn object with the specified color and label.
+        Creates a new Pawn object with the specified color.
         :param color: piece color as a Color enumeration member
         """
-        super().__init__(color, 'p')
-        self._first_move = True  # Whether this is the pawn's first move
+        super().__init__(color)
 
-    def handle_move(self, start_square: np.array, goal_square: np.array) -> None:
-        """
-        Reacts to the pawn being moved from the given start square to the given goal square.
-        :param start_square: the start position as a vector [row, column]
-        :param goal_square: the goal position as a vector [row, column]
-        :return: No return value
-        """
-        # If this is the pawn's first move, set first_move flag to False
-        if self._first_move:
-            self._first_move = False
+        # Resolve the color-dependent parts of the moveset once so that move checks do not branch on the color:
+        # white pawns start on the second to last row and move towards row 0, black pawns start on row 1 and move
+        # towards the last row. The starting row is stored as an offset that is wrapped by the board height.
+        if self._is_white:
+            self._starting_row_offset = -2
+            self._forward_step = -1
+        else:
+            self._starting_row_offset = 1
+            self._forward_step = 1
 
-    def move_legal(self, start_square: np.array, goal_square: np.array, board: "Board") -> bool:
+    def get_move_error(self, start_square: tuple[int, int], goal_square: tuple[int, int],
+                       board: "Board") -> Optional[MoveError]:
         """
         Check if a proposed move is legal according to the pawn's moveset and current state of the game board.
         This method also verifies if any other pieces are in the way of the proposed move.
-        :param start_square: the start position as a vector [row, column]
-        :param goal_square: the goal position as a vector [row, column]
+        :param start_square: the start position as a tuple (row, column)
+        :param goal_square: the goal position as a tuple (row, column)
         :param board: the game's board as a Board object
-        :return:    Boolean:
-                    False if move is illegal
-                    True if move is legal
+        :return: None if the move is legal, otherwise the reason why it is illegal as a MoveError enumeration member
         """
+        # Pawns can never move backwards, so a pawn that is still on its starting row has not moved yet
+        first_move = start_square[0] == self._starting_row_offset % board.get_height()
+
+        # Number of rows the pawn moves forward, negative when moving backwards
+        row_distance = (goal_square[0] - start_square[0]) * self._forward_step
+
+        # Accept the legal moves right away with a single lookup, and only check the rules below one by one to find
+        # out why a move is illegal
+        step = (row_distance, goal_square[1] - start_square[1])
+        if step in (self._first_move_steps if first_move else self._steps):
+            if (not board.square_occupied(goal_square) and
+                    not straight_move_requires_jump(start_square, goal_square, board.get_occupancy())):
+                return None
+        elif step in self._capture_steps and board.square_occupied(goal_square):
+            return None
+
         # Don't allow moving forward more than 2 spaces on first turn
-        if self._first_move and abs(goal_square[0] - start_square[0]) > 2:
-            print("Pawns cannot move more than 2 spaces forward on their first turn!\n")
-            return False
+        if first_move and abs(row_distance) > 2:
+            return MoveError.PAWN_FIRST_MOVE_TOO_FAR
 
         # Don't allow jumping over another piece
-        if (self._first_move and goal_square[1] == start_square[1] and
-                straight_move_requires_jump(start_square, goal_square, board)):
-            print("Pawns cannot jump over other pieces.\n")
-            return False
+        if (first_move and goal_square[1] == start_square[1] and
+                straight_move_requires_jump(start_square, goal_square, board.get_occupancy())):
+            return MoveError.PAWN_JUMP
 
         # Don't allow moving backwards or sideways
-        if ((self._color == Color.WHITE and goal_square[0] > start_square[0])
-                or (self._color == Color.BLACK and goal_square[0] < start_square[0])):
-            print("Pawns cannot move backwards!\n")
-            return False
+        if row_distance < 0:
+            return MoveError.PAWN_BACKWARDS
 
-        if goal_square[0] == start_square[0]:
-            print("Pawns cannot move sideways!\n")
-            return False
+        if row_distance == 0:
+            return MoveError.PAWN_SIDEWAYS
 
         # Check forward movement after the first turn
-        if not self._first_move and goal_square[1] == start_square[1] and abs(goal_square[0] - start_square[0]) > 1:
-            print("Pawns cannot move more than 1 space forward after their first turn!\n")
-            return False
+        if not first_move and goal_square[1] == start_square[1] and row_distance > 1:
+            return MoveError.PAWN_TOO_FAR
 
-        # Get object on goal square to check if diagonal moves are allowed
-        piece_on_goal_square = board.get_current_piece_on_square(goal_square)
+        # Check if the goal square is occupied to see if diagonal moves are allowed, the piece itself is not needed
+        goal_square_occupied = board.square_occupied(goal_square)
 
         # Don't allow moving straight forward onto a square with another piece
-        if start_square[1] == goal_square[1] and piece_on_goal_square:
-            print("Pawns cannot capture by moving straight forward.\n")
-            return False
+        if start_square[1] == goal_square[1] and goal_square_occupied:
+            return MoveError.PAWN_STRAIGHT_CAPTURE
 
         # Don't allow diagonal movement to columns more than 1 square away
-        if abs(start_square[1] - goal_square[1]) > 1:
-            print("Pawns cannot move more than one square diagonally.\n")
-            return False
+        column_distance = abs(goal_square[1] - start_square[1])
+        if column_distance > 1:
+            return MoveError.PAWN_DIAGONAL_TOO_FAR
 
         # Don't allow diagonal movement to empty squares
-        if abs(start_square[1] - goal_square[1]) == 1 and not piece_on_goal_square:
-            print("Pawns cannot move diagonally to an empty square.\n")
-            return False
+        if column_distance == 1 and not goal_square_occupied:
+            return MoveError.PAWN_DIAGONAL_TO_EMPTY
 
         # If we get to this point, the proposed move is legal
-        return True
+        return None
+
+
+def build_step_table(width: int, height: int, offsets: Collection[tuple[int, int]]) -> list[int]:
+    """
+    Builds a table holding, for every square index (row * width + column), a bitmask of the square indices that can
+    be reached from it with a single step by one of the given offsets without leaving the board.
+    :param width: number of columns on the board as an integer
+    :param height: number of rows on the board as an integer
+    :param offsets: the (row offset, column offset) tuples a piece can move by
+    :return: list of bitmasks indexed by square index
+    """
+    table = []
+    for row in range(height):
+        for column in range(width):
+            mask = 0
+            for row_offset, column_offset in offsets:
+                goal_row = row + row_offset
+                goal_column = column + column_offset
+                if 0 <= goal_row < height and 0 <= goal_column < width:
+                    mask |= 1 << (goal_row * width + goal_column)
+            table.append(mask)
+    return table
+
+
+# Dimensions of the standard chess board, shared by the Board class and the precomputed move tables
+BOARD_WIDTH = 8
+BOARD_HEIGHT = 8
+
+# For every start square, a bitmask of the goal squares a knight or a king can move to
+KNIGHT_MOVES = build_step_table(BOARD_WIDTH, BOARD_HEIGHT,
+                                ((1, 2), (1, -2), (-1, 2), (-1, -2), (2, 1), (2, -1), (-2, 1), (-2, -1)))
+KING_MOVES = build_step_table(BOARD_WIDTH, BOARD_HEIGHT, [(row_offset, column_offset)
+                                                          for row_offset in (-1, 0, 1) for column_offset in (-1, 0, 1)
+                                                          if row_offset != 0 or column_offset != 0])
 
 
 class Knight(ChessPiece):
@@ -187,36 +310,27 @@ class Knight(ChessPiece):
     Not responsible for checking other movement conditions. These checks are done by Chess instead.
     Inherits from ChessPiece.
     """
+    __slots__ = ()
+    _base_label = 'k'
 
-    def __init__(self, color: Color) -> None:
-        """
-        Creates a new Knight object with the specified color and label.
-        :param color: piece color as a Color enumeration member
-        """
-        super().__init__(color, 'k')
-
-    def move_legal(self, start_square: np.array, goal_square: np.array, board: "Board") -> bool:
+    def get_move_error(self, start_square: tuple[int, int], goal_square: tuple[int, int],
+                       board: "Board") -> Optional[MoveError]:
         """
         Check if a proposed move is legal according to the knight's moveset.
         Knights are allowed to jump over other pieces.
-        :param start_square: the start position as a vector [row, column]
-        :param goal_square: the goal position as a vector [row, column]
+        :param start_square: the start position as a tuple (row, column)
+        :param goal_square: the goal position as a tuple (row, column)
         :param board: the game's board as a Board object
-        :return:    Boolean:
-                    False if move is illegal
-                    True if move is legal
+        :return: None if the move is legal, otherwise the reason why it is illegal as a MoveError enumeration member
         """
-        # Can move one square left or right and two squares up or down
-        if abs(goal_square[1] - start_square[1]) == 1 and abs(goal_square[0] - start_square[0]) == 2:
-            return True
-
-        # Can move two squares left or right and one square up or down
-        if abs(goal_square[1] - start_square[1]) == 2 and abs(goal_square[0] - start_square[0]) == 1:
-            return True
+        # Can move one square left or right and two squares up or down, or two squares left or right and one square
+        # up or down
+        width = board.get_width()
+        if (KNIGHT_MOVES[start_square[0] * width + start_square[1]] >> (goal_square[0] * width + goal_square[1])) & 1:
+            return None
 
         # Otherwise, the move is not legal
-        print("The knight can only move in a 2+1 or 1+2 L shape!\n")
-        return False
+        return MoveError.KNIGHT_SHAPE
 
 
 class Bishop(ChessPiece):
@@ -226,37 +340,32 @@ class Bishop(ChessPiece):
     Not responsible for checking other movement conditions. These checks are done by Chess instead.
     Inherits from ChessPiece.
     """
+    __slots__ = ()
+    _base_label = 'b'
 
-    def __init__(self, color: Color) -> None:
-        """
-        Creates a new Bishop object with the specified color and label.
-        :param color: piece color as a Color enumeration member
-        """
-        super().__init__(color, 'b')
-
-    def move_legal(self, start_square: np.array, goal_square: np.array, board: "Board") -> bool:
+    def get_move_error(self, start_square: tuple[int, int], goal_square: tuple[int, int],
+                       board: "Board") -> Optional[MoveError]:
         """
         Check if a proposed move is legal according to the bishop's moveset and current state of the game board.
         This method also verifies if any other pieces are in the way of the proposed move.
-        :param start_square: the start position as a vector [row, column]
-        :param goal_square: the goal position as a vector [row, column]
+        :param start_square: the start position as a tuple (row, column)
+        :param goal_square: the goal position as a tuple (row, column)
         :param board: the game's board as a Board object
-        :return:    Boolean:
-                    False if move is illegal
-                    True if move is legal
+        :return: None if the move is legal, otherwise the reason why it is illegal as a MoveError enumeration member
         """
-        # We must check that we move the same number horizontally as vertically to reach goal square
-        if abs(goal_square[1] - start_square[1]) != abs(goal_square[0] - start_square[0]):
-            print("Bishops can only move diagonally!\n")
-            return False
+        # We must check that we move the same number horizontally as vertically to reach goal square, comparing the
+        # distances against each other and their negation is cheaper than calling abs() on both
+        row_distance = goal_square[0] - start_square[0]
+        column_distance = goal_square[1] - start_square[1]
+        if row_distance != column_distance and row_distance != -column_distance:
+            return MoveError.BISHOP_SHAPE
 
         # If the proposed move requires a jump, the move is illegal
-        if diagonal_move_requires_jump(start_square, goal_square, board):
-            print("Bishops cannot jump over other pieces!\n")
-            return False
+        if diagonal_move_requires_jump(start_square, goal_square, board.get_occupancy()):
+            return MoveError.BISHOP_JUMP
 
         # Otherwise, no jumps are required and the proposed move is legal
-        return True
+        return None
 
 
 class Rook(ChessPiece):
@@ -266,37 +375,29 @@ class Rook(ChessPiece):
     Not responsible for checking other movement conditions. These checks are done by Chess instead.
     Inherits from ChessPiece.
     """
+    __slots__ = ()
+    _base_label = 'r'
 
-    def __init__(self, color: Color) -> None:
-        """
-        Creates a new Rook object with the specified color and label.
-        :param color: piece color as a Color enumeration member
-        """
-        super().__init__(color, 'r')
-
-    def move_legal(self, start_square: np.array, goal_square: np.array, board: "Board") -> bool:
+    def get_move_error(self, start_square: tuple[int, int], goal_square: tuple[int, int],
+                       board: "Board") -> Optional[MoveError]:
         """
         Check if a proposed move is legal according to the rook's moveset and current state of the game board.
         This method also verifies if any other pieces are in the way of the proposed move.
-        :param start_square: the start position as a vector [row, column]
-        :param goal_square: the goal position as a vector [row, column]
+        :param start_square: the start position as a tuple (row, column)
+        :param goal_square: the goal position as a tuple (row, column)
         :param board: the game's board as a Board object
-        :return:    Boolean:
-                    False if move is illegal
-                    True if move is legal
+        :return: None if the move is legal, otherwise the reason why it is illegal as a MoveError enumeration member
         """
         # Is goal_square on the same column or row as start_square?
         if goal_square[1] != start_square[1] and goal_square[0] != start_square[0]:
-            print("Rooks can only move horizontally or vertically!\n")
-            return False
+            return MoveError.ROOK_SHAPE
 
         # If the proposed move requires a jump, the move is illegal
-        if straight_move_requires_jump(start_square, goal_square, board):
-            print("Rooks cannot jump over other pieces!\n")
-            return False
+        if straight_move_requires_jump(start_square, goal_square, board.get_occupancy()):
+            return MoveError.ROOK_JUMP
 
         # Otherwise, no jumps are required and the proposed move is legal
-        return True
+        return None
 
 
 class Queen(ChessPiece):
@@ -306,45 +407,36 @@ class Queen(ChessPiece):
     Not responsible for checking other movement conditions. These checks are done by Chess instead.
     Inherits from ChessPiece.
     """
+    __slots__ = ()
+    _base_label = 'q'
 
-    def __init__(self, color: Color) -> None:
-        """
-        Creates a new Queen object with the specified color and label.
-        :param color: piece color as a Color enumeration member
-        """
-        super().__init__(color, 'q')
-
-    def move_legal(self, start_square: np.array, goal_square: np.array, board: "Board") -> bool:
+    def get_move_error(self, start_square: tuple[int, int], goal_square: tuple[int, int],
+                       board: "Board") -> Optional[MoveError]:
         """
         Check if a proposed move is legal according to the queen's moveset and current state of the game board.
         This method also verifies if any other pieces are in the way of the proposed move.
-        :param start_square: the start position as a vector [row, column]
-        :param goal_square: the goal position as a vector [row, column]
+        :param start_square: the start position as a tuple (row, column)
+        :param goal_square: the goal position as a tuple (row, column)
         :param board: the game's board as a Board object
-        :return:    Boolean:
-                    False if move is illegal
-                    True if move is legal
-        """
-        # We must check that we move either diagonally or straight up/down/left/right
-        distance = goal_square - start_square
-        abs_dist = abs(distance)
-        if abs_dist[0] != abs_dist[1] and np.array_equal(goal_square, start_square):
-            print("A queen can only move diagonally, or straight up, down, left or right!\n")
-            return False
-
-        # If a proposed diagonal move requires a jump, the move is illegal
-        if diagonal_move_requires_jump(start_square, goal_square, board):
-            print("A queen cannot jump over other pieces!\n")
-            return False
+        :return: None if the move is legal, otherwise the reason why it is illegal as a MoveError enumeration member
+        """
+        # We must check that we move either straight up/down/left/right or diagonally, and only check the path
+        # that matches the shape of the move for jumps
+        row_distance = goal_square[0] - start_square[0]
+        column_distance = goal_square[1] - start_square[1]
+        if row_distance == 0 or column_distance == 0:
+            requires_jump = straight_move_requires_jump(start_square, goal_square, board.get_occupancy())
+        elif row_distance == column_distance or row_distance == -column_distance:
+            requires_jump = diagonal_move_requires_jump(start_square, goal_square, board.get_occupancy())
+        else:
+            return MoveError.QUEEN_SHAPE
 
-        # If a proposed straight move requires a jump, the move is illegal
-        if ((goal_square[1] == start_square[1] or goal_square[0] == start_square[0]) and
-                straight_move_requires_jump(start_square, goal_square, board)):
-            print("A queen cannot jump over other pieces!\n")
-            return False
+        # If the proposed move requires a jump, the move is illegal
+        if requires_jump:
+            return MoveError.QUEEN_JUMP
 
         # Otherwise, no jumps are required and the proposed move is legal
-        return True
+        return None
 
 
 class King(ChessPiece):
@@ -354,150 +446,174 @@ class King(ChessPiece):
     Not responsible for checking other movement conditions. These checks are done by Chess instead.
     Inherits from ChessPiece.
     """
+    __slots__ = ()
+    _base_label = 'g'
 
-    def __init__(self, color: Color) -> None:
-        """
-        Creates a new King object with the specified color and label.
-        :param color: piece color as a Color enumeration member
-        """
-        super().__init__(color, 'g')
-
-    def move_legal(self, start_square: np.array, goal_square: np.array, board: "Board") -> bool:
+    def get_move_error(self, start_square: tuple[int, int], goal_square: tuple[int, int],
+                       board: "Board") -> Optional[MoveError]:
         """
         Check if a proposed move is legal according to the king's moveset.
         Since a king can only move one space in each direction, we do not have to check for jumps.
-        :param start_square: the start position as a vector [row, column]
-        :param goal_square: the goal position as a vector [row, column]
+        :param start_square: the start position as a tuple (row, column)
+        :param goal_square: the goal position as a tuple (row, column)
         :param board: the game's board as a Board object
-        :return:    Boolean:
-                    False if move is illegal
-                    True if move is legal
+        :return: None if the move is legal, otherwise the reason why it is illegal as a MoveError enumeration member
         """
         # Move is illegal if goal square is more than one square away from start square
-        if abs(goal_square[1] - start_square[1]) > 1 or abs(goal_square[0] - start_square[0]) > 1:
-            print("A king can only move one square in any direction!\n")
-            return False
+        width = board.get_width()
+        if not (KING_MOVES[start_square[0] * width + start_square[1]] >> (goal_square[0] * width + goal_square[1])) & 1:
+            return MoveError.KING_SHAPE
 
         # Otherwise, the proposed move is legal
-        return True
+        return None
 
 
-class Falcon(ChessPiece):
+class FairyPiece(ChessPiece):
     """
-    Represents a falcon chess piece with a color and label.
-    Responsible for ensuring that a falcon can only attempt movements defined within its moveset.
+    Represents a fairy chess piece that moves straight in one direction (forward or backward) and diagonally in the
+    other, and never straight left or right.
+    Responsible for ensuring that a fairy piece can only attempt movements defined within its moveset.
     Not responsible for checking other movement conditions. These checks are done by Chess instead.
-    Inherits from ChessPiece.
+    Inherits from ChessPiece. Child classes choose the direction of the straight moves and the reported MoveErrors.
     """
-
-    def __init__(self, color: Color) -> None:
-        """
-        Creates a new Falcon object with the specified color and label.
-        :param color: piece color as a Color enumeration member
-        """
-        super().__init__(color, 'f')
-
-    def move_legal(self, start_square: np.array, goal_square: np.array, board: "Board") -> bool:
-        """
-        Check if a proposed move is legal according to the falcon's moveset and current state of the game board.
+    __slots__ = ()
+    # Whether the piece moves straight when moving forward (and diagonally when moving backward), or the reverse
+    _straight_forward: bool
+    # Reasons reported for illegal sideways, forward, backward and jumping moves
+    _sideways_error: MoveError
+    _forward_error: MoveError
+    _backward_error: MoveError
+    _jump_error: MoveError
+
+    def get_move_error(self, start_square: tuple[int, int], goal_square: tuple[int, int],
+                       board: "Board") -> Optional[MoveError]:
+        """
+        Check if a proposed move is legal according to the fairy piece's moveset and current state of the game board.
         This method also verifies if any other pieces are in the way of the proposed move.
-        :param start_square: the start position as a vector [row, column]
-        :param goal_square: the goal position as a vector [row, column]
+        :param start_square: the start position as a tuple (row, column)
+        :param goal_square: the goal position as a tuple (row, column)
         :param board: the game's board as a Board object
-        :return:    Boolean:
-                    False if move is illegal
-                    True if move is legal
+        :return: None if the move is legal, otherwise the reason why it is illegal as a MoveError enumeration member
         """
-        # Falcon's cannot move straight left or right
-        if start_square[0] == goal_square[0]:
-            print("Falcons cannot move straight left or right!\n")
-            return False
+        row_distance = goal_square[0] - start_square[0]
+        column_distance = goal_square[1] - start_square[1]
 
-        # If we are trying to move backwards, but not within the same column, the move is illegal
-        if (((self._color == Color.WHITE and goal_square[0] > start_square[0]) or
-                (self._color == Color.BLACK and goal_square[0] < start_square[0])) and
-                goal_square[1] != start_square[1]):
-            print("Falcons can only move straight backwards!\n")
-            return False
+        # Fairy pieces cannot move straight left or right
+        if row_distance == 0:
+            return self._sideways_error
 
-        # If we are trying to move forward, but not on a diagonal, the move is illegal
-        if (((self._color == Color.WHITE and goal_square[0] < start_square[0]) or
-                (self._color == Color.BLACK and goal_square[0] > start_square[0])) and
-                abs(goal_square[1] - start_square[1]) != abs(goal_square[0] - start_square[0])):
-            print("Falcons can only move diagonally forward!\n")
-            return False
+        # White moves forward towards row 0, black moves forward towards the last row
+        forward = (row_distance < 0) == self._is_white
 
-        # # If a proposed straight move requires a jump, the move is illegal
-        if goal_square[1] == start_square[1] and straight_move_requires_jump(start_square, goal_square, board):
-            print("A falcon cannot jump over other pieces!\n")
-            return False
+        # Moving in the straight direction must stay within the same column, moving in the diagonal direction must
+        # travel as many columns as rows
+        straight = forward == self._straight_forward
+        if ((straight and column_distance != 0) or
+                (not straight and column_distance != row_distance and column_distance != -row_distance)):
+            return self._forward_error if forward else self._backward_error
 
-        # If a proposed diagonal move requires a jump, the move is illegal
-        if diagonal_move_requires_jump(start_square, goal_square, board):
-            print("A falcon cannot jump over other pieces!\n")
-            return False
+        # If the proposed move requires a jump, the move is illegal
+        if straight:
+            requires_jump = straight_move_requires_jump(start_square, goal_square, board.get_occupancy())
+        else:
+            requires_jump = diagonal_move_requires_jump(start_square, goal_square, board.get_occupancy())
+        if requires_jump:
+            return self._jump_error
 
         # Otherwise, the proposed move is legal
-        return True
+        return None
 
 
-class Hunter(ChessPiece):
+class Falcon(FairyPiece):
     """
-    Represents a hunter chess piece with a color and label.
-    Responsible for ensuring that a hunter can only attempt movements defined within its moveset.
-    Not responsible for checking other movement conditions. These checks are done by Chess instead.
-    Inherits from ChessPiece.
+    Represents a falcon chess piece with a color and label.
+    A falcon moves forward like a bishop and backward like a rook.
+    Inherits from FairyPiece.
     """
+    __slots__ = ()
+    _base_label = 'f'
+    _straight_forward = False
+    _sideways_error = MoveError.FALCON_SIDEWAYS
+    _forward_error = MoveError.FALCON_FORWARD
+    _backward_error = MoveError.FALCON_BACKWARD
+    _jump_error = MoveError.FALCON_JUMP
 
-    def __init__(self, color: Color) -> None:
-        """
-        Creates a new Hunter object with the specified color and label.
-        :param color: piece color as a Color enumeration member
-        """
-        super().__init__(color, 'h')
 
-    def move_legal(self, start_square: np.array, goal_square: np.array, board: "Board") -> bool:
-        """
-        Check if a proposed move is legal according to the hunter's moveset and current state of the game board.
-        This method also verifies if any other pieces are in the way of the proposed move.
-        :param start_square: the start position as a vector [row, column]
-        :param goal_square: the goal position as a vector [row, column]
-        :param board: the game's board as a Board object
-        :return:    Boolean:
-                    False if move is illegal
-                    True if move is legal
-        """
-        # Hunter's cannot move straight left or right
-        if start_square[0] == goal_square[0]:
-            print("Hunters cannot move straight left or right!\n")
-            return False
+class Hunter(FairyPiece):
+    """
+    Represents a hunter chess piece with a color and label.
+    A hunter moves forward like a rook and backward like a bishop.
+    Inherits from FairyPiece.
+    """
+    __slots__ = ()
+    _base_label = 'h'
+    _straight_forward = True
+    _sideways_error = MoveError.HUNTER_SIDEWAYS
+    _forward_error = MoveError.HUNTER_FORWARD
+    _backward_error = MoveError.HUNTER_BACKWARD
+    _jump_error = MoveError.HUNTER_JUMP
+
+
+# Shared piece instances. Chess pieces carry no state that changes during a game, so every board can place the same
+# objects instead of allocating new ones.
+WHITE_PAWN = Pawn(Color.WHITE)
+WHITE_KNIGHT = Knight(Color.WHITE)
+WHITE_BISHOP = Bishop(Color.WHITE)
+WHITE_ROOK = Rook(Color.WHITE)
+WHITE_QUEEN = Queen(Color.WHITE)
+WHITE_KING = King(Color.WHITE)
+BLACK_PAWN = Pawn(Color.BLACK)
+BLACK_KNIGHT = Knight(Color.BLACK)
+BLACK_BISHOP = Bishop(Color.BLACK)
+BLACK_ROOK = Rook(Color.BLACK)
+BLACK_QUEEN = Queen(Color.BLACK)
+BLACK_KING = King(Color.BLACK)
+WHITE_FALCON = Falcon(Color.WHITE)
+WHITE_HUNTER = Hunter(Color.WHITE)
+BLACK_FALCON = Falcon(Color.BLACK)
+BLACK_HUNTER = Hunter(Color.BLACK)
+
+# Every piece instance indexed by the code that represents it on a board's grid, code 0 stands for an empty square
+PIECES: tuple[Optional[ChessPiece], ...] = (
+    None, WHITE_PAWN, WHITE_KNIGHT, WHITE_BISHOP, WHITE_ROOK, WHITE_QUEEN, WHITE_KING, WHITE_FALCON, WHITE_HUNTER,
+    BLACK_PAWN, BLACK_KNIGHT, BLACK_BISHOP, BLACK_ROOK, BLACK_QUEEN, BLACK_KING, BLACK_FALCON, BLACK_HUNTER
+)
+PIECE_CODES = {piece: code for code, piece in enumerate(PIECES) if piece is not None}
+
+
+def build_between_table(width: int, height: int) -> list[list[int]]:
+    """
+    Precomputes the squares that lie strictly between any two squares sharing a row, column or diagonal.
+    Squares are indexed as row * width + column.
+    :param width: board width as an integer
+    :param height: board height as an integer
+    :return: list of lists where table[start][goal] is a bitboard of the squares between start and goal,
+             0 if the two squares are adjacent or do not share a row, column or diagonal
+    """
+    table = [[0] * (width * height) for _ in range(width * height)]
+    for start_row in range(height):
+        for start_column in range(width):
+            start = start_row * width + start_column
+            # Walk outwards in each of the eight directions, collecting the squares passed on the way
+            for row_step, column_step in ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)):
+                between = 0
+                row, column = start_row + row_step, start_column + column_step
+                while 0 <= row < height and 0 <= column < width:
+                    table[start][row * width + column] = between
+                    between |= 1 << (row * width + column)
+                    row += row_step
+                    column += column_step
 
-        # If we are trying to move diagonally forward, the move is illegal
-        if (((self._color == Color.WHITE and goal_square[0] < start_square[0]) or
-            (self._color == Color.BLACK and goal_square[0] > start_square[0])) and
-                goal_square[1] != start_square[1]):
-            print("Hunters can only move straight forward!\n")
-            return False
+    return table
 
-        # If we are trying to move straight backward, the move is illegal
-        if (((self._color == Color.WHITE and goal_square[0] > start_square[0]) or
-            (self._color == Color.BLACK and goal_square[0] < start_square[0])) and
-                abs(goal_square[1] - start_square[1]) != abs(goal_square[0] - start_square[0])):
-            print("Hunters can only move diagonally backward!\n")
-            return False
 
-        # If a proposed straight move requires a jump, the move is illegal
-        if goal_square[1] == start_square[1] and straight_move_requires_jump(start_square, goal_square, board):
-            print("A hunter cannot jump over other pieces!\n")
-            return False
+# Squares between any two squares of the board, shared by all Board objects
+BETWEEN = build_between_table(BOARD_WIDTH, BOARD_HEIGHT)
 
-        # If a proposed diagonal move requires a jump, the move is illegal
-        if diagonal_move_requires_jump(start_square, goal_square, board):
-            print("A hunter cannot jump over other pieces!\n")
-            return False
-
-        # Otherwise, no jumps are required and the proposed move is legal
-        return True
+# Names of the squares of the board in 'ColRow' format mapped to (row, column) tuples, and back
+PARSE_SQUARE = {f"{chr(ord('a') + column)}{BOARD_HEIGHT - row}": (row, column)
+                for row in range(BOARD_HEIGHT) for column in range(BOARD_WIDTH)}
+FORMAT_SQUARE = {square: name for name, square in PARSE_SQUARE.items()}
 
 
 class Board:
@@ -510,35 +626,47 @@ class Board:
     Needs to communicate with the ChessPiece class (and its various child classes) since these pieces can be present on
     the board. Also communicates with the Chess class to update its layout when needed.
     """
-    # Explicitly specify expected types for the Board layout
-    _layout: list[list[ChessPiece | None]]
+    # Explicitly specify expected types for the Board grid
+    _grid: array
 
     def __init__(self) -> None:
         """
         Creates a new Board object.
-        The chess board is represented by a list of lists.
-        Each sublist represents a row of the Board, containing ChessPiece objects.
-        The first sublist corresponds to row label 8 on the chess board.
-        The last sublist corresponds to row label 1 on the chess board.
-        The elements of each sublist represent columns labeled a - h on the chess board.
-        If a square on the board is empty, its value is None.
-        """
-        b = Color.BLACK
-        w = Color.WHITE
-        self._layout = [
-            [Rook(b), Knight(b), Bishop(b), Queen(b), King(b), Bishop(b), Knight(b), Rook(b)],
-            [Pawn(b), Pawn(b), Pawn(b), Pawn(b), Pawn(b), Pawn(b), Pawn(b), Pawn(b)],
+        The chess board is represented by a flat array of piece codes, one signed byte per square, in row-major order.
+        The square (row, column) is stored at index row * width + column, and the code is an index into PIECES.
+        The first row corresponds to row label 8 on the chess board.
+        The last row corresponds to row label 1 on the chess board.
+        The columns within each row are labeled a - h on the chess board.
+        If a square on the board is empty, its code is 0.
+        """
+        layout = [
+            [BLACK_ROOK, BLACK_KNIGHT, BLACK_BISHOP, BLACK_QUEEN, BLACK_KING, BLACK_BISHOP, BLACK_KNIGHT, BLACK_ROOK],
+            [BLACK_PAWN, BLACK_PAWN, BLACK_PAWN, BLACK_PAWN, BLACK_PAWN, BLACK_PAWN, BLACK_PAWN, BLACK_PAWN],
             [None, None, None, None, None, None, None, None],
             [None, None, None, None, None, None, None, None],
             [None, None, None, None, None, None, None, None],
             [None, None, None, None, None, None, None, None],
-            [Pawn(w), Pawn(w), Pawn(w), Pawn(w), Pawn(w), Pawn(w), Pawn(w), Pawn(w)],
-            [Rook(w), Knight(w), Bishop(w), Queen(w), King(w), Bishop(w), Knight(w), Rook(w)]
+            [WHITE_PAWN, WHITE_PAWN, WHITE_PAWN, WHITE_PAWN, WHITE_PAWN, WHITE_PAWN, WHITE_PAWN, WHITE_PAWN],
+            [WHITE_ROOK, WHITE_KNIGHT, WHITE_BISHOP, WHITE_QUEEN, WHITE_KING, WHITE_BISHOP, WHITE_KNIGHT, WHITE_ROOK]
         ]
+        self._grid = array('b', [PIECE_CODES[piece] if piece else 0 for row in layout for piece in row])
 
-        self._width = 8
-        self._height = 8
+        self._width = BOARD_WIDTH
+        self._height = BOARD_HEIGHT
         self._start_ord = ord('a')
+        # Column labels printed above and below the board
+        column_ords = range(self._start_ord, self._start_ord + self._width)
+        self._column_labels = '  ' + ''.join(f" {chr(val)} " for val in column_ords)
+
+        # Occupancy bitboard: bit (row * width + column) is set if that square contains a chess piece.
+        # The grid above remains the source of truth for which piece is on a square.
+        # Color bitboards: bit (row * width + column) is set if that square contains a chess piece of that color.
+        self._occupancy = 0
+        self._color_bitboards = {Color.WHITE: 0, Color.BLACK: 0}
+        for index, code in enumerate(self._grid):
+            if code:
+                self._occupancy |= 1 << index
+                self._color_bitboards[PIECES[code].get_color()] |= 1 << index
 
     def get_width(self) -> int:
         """
@@ -561,161 +689,162 @@ class Board:
         """
         return self._start_ord
 
-    def get_current_piece_on_square(self, square: np.array) -> Optional[ChessPiece]:
+    def get_current_piece_on_square(self, square: tuple[int, int]) -> Optional[ChessPiece]:
         """
         Get the current chess piece on the specified square.
-        :param square: square as a vector [row, column]
+        :param square: square as a tuple (row, column)
         :return: ChessPiece object currently located on square, None if the square is empty
         """
-        return self._layout[square[0]][square[1]]
+        return PIECES[self._grid[square[0] * self._width + square[1]]]
+
+    def get_occupancy(self) -> int:
+        """
+        Get the board's occupancy bitboard.
+        :return: integer with bit (row * width + column) set for every square that contains a chess piece
+        """
+        return self._occupancy
+
+    def square_occupied(self, square: tuple[int, int]) -> bool:
+        """
+        Determines if the specified square contains a chess piece.
+        :param square: square as a tuple (row, column)
+        :return:    Boolean:
+                    True if the square contains a chess piece
+                    False if the square is empty
+        """
+        return (self._occupancy >> (square[0] * self._width + square[1])) & 1 == 1
+
+    def square_occupied_by(self, square: tuple[int, int], color: Color) -> bool:
+        """
+        Determines if the specified square contains a chess piece of the specified color.
+        :param square: square as a tuple (row, column)
+        :param color: piece color as a Color enumeration member
+        :return:    Boolean:
+                    True if the square contains a chess piece of that color
+                    False if the square is empty or contains a piece of the other color
+        """
+        return (self._color_bitboards[color] >> (square[0] * self._width + square[1])) & 1 == 1
 
-    def square_on_board(self, square: np.array) -> bool:
+    def square_on_board(self, square: tuple[int, int]) -> bool:
         """
         Determines if the specified square lies within the bounds of the game board.
-        :param square: square as a vector [row, column]
+        :param square: square as a tuple (row, column)
         :return:    Boolean:
                     True if square lies within the bounds of the board
                     False otherwise
         """
-        if square[0] < 0 or square[0] >= self.get_height():
-            return False
-
-        if square[1] < 0 or square[1] >= self.get_width():
-            return False
-
-        return True
+        # The board is 8x8, so a square is on the board exactly if neither coordinate has a bit set above the lowest
+        # three. Negative coordinates have all of their high bits set.
+        return (square[0] | square[1]) & ~7 == 0
 
     def print(self) -> None:
         """
         Prints out the current layout of the board.
         :return: No return value
         """
-        # Print column labels at the top
-        print('  ', end='')
-        for val in range(self._start_ord, self._start_ord + self._width):
-            print(f" {chr(val)} ", end='')
-        print('\n')
-
+        # Build the whole board as one string so it can be written out at once.
+        # Empty squares are shown as an underscore, occupied squares show the piece's label.
+        lines = [self._column_labels]
         curr_row = self._height
-        for row in self._layout:
-            print(f"{curr_row} ", end='')
-            for piece in row:
-                # If there is no piece on the square, print an underscore character
-                if not piece:
-                    print(' _ ', end='')
-                # If there is a piece, print its label
-                else:
-                    print(f" {piece.get_label()} ", end='')
-            # Move to next line
-            print('\n')
+        for start in range(0, self._height * self._width, self._width):
+            lines.append(f"{curr_row} " + ''.join(f" {PIECES[code].get_label()} " if code else ' _ '
+                                                  for code in self._grid[start:start + self._width]))
             curr_row -= 1
+        lines.append(self._column_labels)
 
-        # Print column labels at the bottom
-        print('  ', end='')
-        for val in range(self._start_ord, self._start_ord + self._width):
-            print(f" {chr(val)} ", end='')
-        print('\n\n')
+        sys.stdout.write('\n\n'.join(lines) + '\n\n\n')
 
-    def update_move(self, start_square: np.array, goal_square: np.array, piece: ChessPiece) -> None:
+    def update_move(self, start_square: tuple[int, int], goal_square: tuple[int, int], piece: ChessPiece) -> None:
         """
         Update the current state of the board by updating start_square to None (the piece was moved away from this
         square) and goal_square to the specified piece (the piece was moved here).
-        :param start_square: first square as a vector [row, column]
-        :param goal_square: second square as a vector [row, column]
+        :param start_square: first square as a tuple (row, column)
+        :param goal_square: second square as a tuple (row, column)
         :param piece: ChessPiece object to be placed on goal_square
-        :return: No return value, the board layout is updated in place
+        :return: No return value, the board grid is updated in place
         """
-        self._layout[start_square[0]][start_square[1]] = None
+        code = PIECE_CODES[piece]
+        start = start_square[0] * self._width + start_square[1]
+        goal = goal_square[0] * self._width + goal_square[1]
 
-        self._layout[goal_square[0]][goal_square[1]] = piece
+        # A piece captured on the goal square leaves the board
+        captured_code = self._grid[goal]
+        if captured_code:
+            self._color_bitboards[PIECES[captured_code].get_color()] &= ~(1 << goal)
 
-    def update_piece_entered(self, square: np.array, piece: ChessPiece) -> None:
+        self._grid[start] = 0
+        self._grid[goal] = code
+        self._occupancy = self._occupancy & ~(1 << start) | 1 << goal
+        self._color_bitboards[piece.get_color()] ^= 1 << start | 1 << goal
+
+    def update_piece_entered(self, square: tuple[int, int], piece: ChessPiece) -> None:
         """
         Update the current state of the board by entering the specified piece on the specified square.
-        :param square: square as a vector [row, column]
+        :param square: square as a tuple (row, column)
         :param piece: ChessPiece object to be placed on the specified square
-        :return: No return value, the layout is updated in place
+        :return: No return value, the grid is updated in place
         """
-        self._layout[square[0]][square[1]] = piece
+        code = PIECE_CODES[piece]
+        index = square[0] * self._width + square[1]
+        self._grid[index] = code
+        self._occupancy |= 1 << index
+        self._color_bitboards[piece.get_color()] |= 1 << index
 
 
-def traveling_on_axis_requires_jump(start_square: np.array, goal_square: np.array, board: Board,
-                                    axis: np.array) -> bool:
+def path_blocked(start_square: tuple[int, int], goal_square: tuple[int, int], occupancy: int) -> bool:
     """
-    Checks whether other pieces are in the way when moving from the specified start square to the specified goal square
-    along the specified axis (if a move along the axis requires a jump).
-    :param start_square: the start position as a vector [row, column]
-    :param goal_square: the goal position as a vector [row, column]
-    :param board: the game's board as a Board object
-    :param axis: directional axis as a unit vector [x direction, y direction]
+    Determines if any chess piece is located strictly between the specified start and goal square.
+    Only squares that share a row, column or diagonal have squares between them.
+    :param start_square: the start position as a tuple (row, column)
+    :param goal_square: the goal position as a tuple (row, column)
+    :param occupancy: the board's occupancy bitboard as an integer
     :return:    Boolean:
-                True if the move requires a jump
-                False if move doesn't require a jump
+                True if at least one square between start and goal square contains a chess piece
+                False otherwise
     """
-    current_square = start_square + axis
-    while not np.array_equal(current_square, goal_square):
-        # If we encounter another piece, the move requires a jump
-        if board.get_current_piece_on_square(current_square):
-            return True
-
-        current_square += axis
+    start = start_square[0] * BOARD_WIDTH + start_square[1]
+    goal = goal_square[0] * BOARD_WIDTH + goal_square[1]
+    return BETWEEN[start][goal] & occupancy != 0
 
-    # If we reach the goal square, the move did not require any jumps
-    return False
 
-
-def diagonal_move_requires_jump(start_square: np.array, goal_square: np.array, board: Board) -> bool:
+def diagonal_move_requires_jump(start_square: tuple[int, int], goal_square: tuple[int, int], occupancy: int) -> bool:
     """
     Checks whether other pieces are in the way of a proposed diagonal move (if a move requires a jump).
-    :param start_square: the start position as a vector [row, column]
-    :param goal_square: the goal position as a vector [row, column]
-    :param board: the game's board as a Board object
+    :param start_square: the start position as a tuple (row, column)
+    :param goal_square: the goal position as a tuple (row, column)
+    :param occupancy: the board's occupancy bitboard as an integer
     :return:    Boolean:
                 True if the move requires a jump
                 False if move doesn't require a jump
     """
-    # Bottom right direction
-    if goal_square[0] > start_square[0] and goal_square[1] > start_square[1]:
-        return traveling_on_axis_requires_jump(start_square, goal_square, board, np.array([1, 1]))
-
-    # Top right direction
-    if goal_square[0] < start_square[0] and goal_square[1] > start_square[1]:
-        return traveling_on_axis_requires_jump(start_square, goal_square, board, np.array([-1, 1]))
-
-    # Bottom left direction
-    if goal_square[0] > start_square[0] and goal_square[1] < start_square[1]:
-        return traveling_on_axis_requires_jump(start_square, goal_square, board, np.array([1, -1]))
+    # If start and goal square do not share a diagonal, there is no diagonal path to check
+    row_distance = goal_square[0] - start_square[0]
+    column_distance = goal_square[1] - start_square[1]
+    if row_distance != column_distance and row_distance != -column_distance:
+        return False
 
-    # Top left direction
-    if goal_square[0] < start_square[0] and goal_square[1] < start_square[1]:
-        return traveling_on_axis_requires_jump(start_square, goal_square, board, np.array([-1, -1]))
+    return path_blocked(start_square, goal_square, occupancy)
 
 
-def straight_move_requires_jump(start_square: np.array, goal_square: np.array, board: Board) -> bool:
+def straight_move_requires_jump(start_square: tuple[int, int], goal_square: tuple[int, int], occupancy: int) -> bool:
     """
     Checks whether other pieces are in the way of a proposed up/down or left/right move (if a move requires a jump).
-    :param start_square: the start position as a vector [row, column]
-    :param goal_square: the goal position as a vector [row, column]
-    :param board: the game's board as a Board object
+    :param start_square: the start position as a tuple (row, column)
+    :param goal_square: the goal position as a tuple (row, column)
+    :param occupancy: the board's occupancy bitboard as an integer
     :return:    Boolean:
                 True if the move requires a jump
                 False if move doesn't require a jump
     """
-    # Down direction
-    if goal_square[0] > start_square[0]:
-        return traveling_on_axis_requires_jump(start_square, goal_square, board, np.array([1, 0]))
+    # If start and goal square share neither a row nor a column, there is no straight path to check
+    if goal_square[0] != start_square[0] and goal_square[1] != start_square[1]:
+        return False
 
-    # Up direction
-    if goal_square[0] < start_square[0]:
-        return traveling_on_axis_requires_jump(start_square, goal_square, board, np.array([-1, 0]))
+    return path_blocked(start_square, goal_square, occupancy)
 
-    # Left direction
-    if goal_square[1] < start_square[1]:
-        return traveling_on_axis_requires_jump(start_square, goal_square, board, np.array([0, -1]))
 
-    # Right direction
-    if goal_square[1] > start_square[1]:
-        return traveling_on_axis_requires_jump(start_square, goal_square, board, np.array([0, 1]))
+# Labels of the pieces that are considered major pieces: Queen, Rook, Bishop, Knight
+MAJOR_PIECES = frozenset({'q', 'r', 'b', 'k'})
 
 
 class Player:
@@ -726,8 +855,10 @@ class Player:
     Communicates with ChessPiece class and its various child classes to keep track of fairy pieces and captured
     pieces.
     """
-    # Explicitly specify expected types for the fairy pieces list
-    _fairy_pieces: list[ChessPiece]
+    # Players only ever hold these attributes, so they don't need a per-instance __dict__
+    __slots__ = ('_color', '_fairy_pieces', '_captured_pieces', '_captured_display', '_major_pieces_lost')
+    # Explicitly specify expected types for the fairy pieces dictionary
+    _fairy_pieces: dict[str, ChessPiece]
 
     def __init__(self, color: Color) -> None:
         """
@@ -735,16 +866,22 @@ class Player:
         :param color: player color as a string, 'black' or 'white'
         """
         self._color = color
-        # List of ChessPiece objects, represents player's available fairy pieces, starts with one falcon and one hunter
-        self._fairy_pieces = [Falcon(self._color), Hunter(self._color)]
+        # Dictionary of ChessPiece objects keyed by their label, represents player's available fairy pieces, starts
+        # with one falcon and one hunter
+        fairy_pieces = (WHITE_FALCON, WHITE_HUNTER) if color is Color.WHITE else (BLACK_FALCON, BLACK_HUNTER)
+        self._fairy_pieces = {piece.get_label(): piece for piece in fairy_pieces}
         # List of ChessPiece objects, represents player's pieces that have been captured by the other player during
         # previous turns, initially empty
         self._captured_pieces = []
+        # Labels of the captured pieces joined by spaces, kept in sync with the list above for display purposes
+        self._captured_display = ''
+        # Number of major pieces among the captured pieces, kept in sync with the list above
+        self._major_pieces_lost = 0
 
-    def get_fairy_pieces(self) -> Collection[ChessPiece]:
+    def get_fairy_pieces(self) -> dict[str, ChessPiece]:
         """
-        Returns the player's current list of available fairy pieces that can be entered into the game.
-        :return: Python list of ChessPiece objects
+        Returns the player's currently available fairy pieces that can be entered into the game.
+        :return: Python dictionary of ChessPiece objects keyed by their label
         """
         return self._fairy_pieces
 
@@ -755,28 +892,39 @@ class Player:
         """
         return self._captured_pieces
 
+    def get_captured_display(self) -> str:
+        """
+        Returns the labels of the pieces the player has lost in the game so far, separated by spaces.
+        :return: captured piece labels as a string
+        """
+        return self._captured_display
+
     def add_captured_piece(self, captured_piece: ChessPiece) -> None:
         """
         Adds the specified captured piece to the list of captured pieces for this player.
         :param captured_piece: the captured piece as a ChessPiece object
         :return: No return value, the list is changed in place
         """
+        captured_label = captured_piece.get_label()
         self._captured_pieces.append(captured_piece)
+        self._captured_display += captured_label + ' '
+        if captured_piece.get_label_lower() in MAJOR_PIECES:
+            self._major_pieces_lost += 1
 
     def remove_fairy_piece(self, fairy_piece: ChessPiece) -> None:
         """
-        Remove the specified fairy piece from the player's list of available fairy pieces.
+        Remove the specified fairy piece from the player's available fairy pieces.
         :param fairy_piece: the entered fairy piece as a ChessPiece object
-        :return: No return value, the list is changed in place
+        :return: No return value, the dictionary is changed in place
         """
-        self._fairy_pieces.remove(fairy_piece)
+        del self._fairy_pieces[fairy_piece.get_label()]
 
     def print_fairy_pieces(self) -> None:
         """
         Prints out a list of the player's available fairy pieces.
         :return: No return value
         """
-        for fairy_piece in self._fairy_pieces:
+        for fairy_piece in self._fairy_pieces.values():
             print(fairy_piece)
 
     def print_captured_pieces(self) -> None:
@@ -787,13 +935,22 @@ class Player:
         for captured_piece in self._captured_pieces:
             print(captured_piece)
 
-    def count_major_pieces(self, major_pieces: list) -> int:
+    def count_major_pieces(self) -> int:
         """
         Counts how many of the player's major pieces have been captured.
-        :param major_pieces: list of characters, representing labels for pieces that are considered major pieces
         :return: number of major pieces in player's captured pieces as an integer
         """
-        return sum(1 for piece in self._captured_pieces if piece.get_label().lower() in major_pieces)
+        return self._major_pieces_lost
+
+
+# Rules for entering fairy pieces per color: the board rows of the player's home ranks, the labels of the fairy
+# pieces the player may enter, and the errors reported when either rule is broken
+FAIRY_ENTRY_RULES = {
+    Color.WHITE: (frozenset({6, 7}), frozenset({'F', 'H'}),
+                  MoveError.WHITE_OUTSIDE_HOME_RANKS, MoveError.WHITE_ENTERS_BLACK_PIECE),
+    Color.BLACK: (frozenset({0, 1}), frozenset({'f', 'h'}),
+                  MoveError.BLACK_OUTSIDE_HOME_RANKS, MoveError.BLACK_ENTERS_WHITE_PIECE)
+}
 
 
 class Chess:
@@ -807,26 +964,34 @@ class Chess:
     track of the two players, and the ChessPiece class (and its various child classes) to verify if moves are legal
     according to a piece's moveset.
     """
+    # A game only ever holds these attributes, so it doesn't need a per-instance __dict__
+    __slots__ = ('_verbose', '_board', '_white', '_black', '_current_player', '_opposite_player', '_turn',
+                 '_turn_color', '_game_state')
 
-    def __init__(self) -> None:
+    def __init__(self, verbose: bool = True) -> None:
         """
         Creates a new chess game object.
+        :param verbose: whether the game prints status messages and the board after every turn, pass False for
+                        automated play such as benchmarks or AI search
         """
+        self._verbose = verbose
+
         # Initialize the board.
         self._board = Board()
 
-        # Initialize list of major pieces: Queen, Rook, Bishop, King are considered major pieces
-        self._major_pieces = ['q', 'r', 'b', 'k']
-
         # Initialize the two players.
         self._white = Player(Color.WHITE)
         self._black = Player(Color.BLACK)
 
-        self._players = {Color.WHITE: self._white, Color.BLACK: self._black}
+        # The player whose turn it is and the other player, swapped together with the turn counter
+        self._current_player = self._white
+        self._opposite_player = self._black
 
         # White begins per standard chess rules
-        # Even integer: White's turn, odd integer: Black's turn
+        # Odd integer: White's turn, even integer: Black's turn
         self._turn = 1
+        # Color of the player whose turn it is, flipped together with the turn counter
+        self._turn_color = Color.WHITE
 
         # Initialize game state
         self._game_state = GameState.UNFINISHED
@@ -857,201 +1022,220 @@ class Chess:
         Returns current turn's player color.
         :return: current turn's player color as a Color Enum object
         """
-        return Color.WHITE if self._turn % 2 == 1 else Color.BLACK
+        return self._turn_color
 
     def go_to_next_turn(self) -> None:
         """
-        Increments the current turn.
-        :return: No return value, changes self._turn in place
+        Increments the current turn and passes it to the other player.
+        :return: No return value, changes self._turn, self._turn_color and the current and opposite player in place
         """
         self._turn += 1
+        self._turn_color = Color.BLACK if self._turn_color is Color.WHITE else Color.WHITE
+        self._current_player, self._opposite_player = self._opposite_player, self._current_player
 
-    def parse_square(self, square: str) -> np.array:
+    def parse_square(self, square: str) -> tuple[int, int]:
         """
-        Converts a string of format 'ColRow' to a vector of two integers [row, col].
+        Converts a string of format 'ColRow' to a tuple of two integers (row, col).
         :param square: square as a string of two characters representing 'ColRow' on the chess board
-        :return: the specified square as a vector [row, column]
+        :return: the specified square as a tuple (row, column)
         """
+        parsed = PARSE_SQUARE.get(square)
+        if parsed is not None:
+            return parsed
+
+        # Squares that are not on the board are still converted, so that make_move can reject them
         row = self._board.get_height() - int(square[1])
         column = ord(square[0]) - self._board.get_start_ord()
-        return np.array([row, column])
+        return row, column
 
-    def format_square(self, square: np.array) -> str:
+    def format_square(self, square: tuple[int, int]) -> str:
         """
-        Converts a vector of two integers representing a square on the chess board as [row, col] to a string
+        Converts a tuple of two integers representing a square on the chess board as (row, col) to a string
         of format 'ColRow'.
-        :param square: the specified square as a vector [row, column]
+        :param square: the specified square as a tuple (row, column)
         :return: square as a string of two characters representing 'ColRow' on the chess board
         """
-        row_str = self._board.get_height() - square[0]
-        col_str = self._board.get_start_ord() + square[1]
-        return str(col_str) + str(row_str)
+        formatted = FORMAT_SQUARE.get((square[0], square[1]))
+        if formatted is not None:
+            return formatted
+
+        # Squares that are not on the board are still converted using the board's labels
+        return f"{chr(self._board.get_start_ord() + square[1])}{self._board.get_height() - square[0]}"
 
-    def make_move(self, start_square: np.array, goal_square: np.array) -> bool:
+    def attempt_move(self, start_square: tuple[int, int], goal_square: tuple[int, int]) -> Optional[MoveError]:
         """
-        Moves a piece from start_square to goal_square.
-        :param start_square: the start position as a vector [row, column]
-        :param goal_square: the goal position as a vector [row, column]
-        :return:    Boolean:
-                    False if move is illegal or game has already been won
-                    True if move is legal
+        Moves a piece from start_square to goal_square without printing anything.
+        :param start_square: the start position as a tuple (row, column)
+        :param goal_square: the goal position as a tuple (row, column)
+        :return: None if the move was made, otherwise the reason why it is illegal as a MoveError enumeration member
         """
         # Check if move is legal:
         # Is the game over?
-        if self._game_state != GameState.UNFINISHED:
-            print("The game is over! No more moves can be made!\n")
-            return False
-
-        # Are start_square and goal_square within the bounds of the game board?
-        if not self._board.square_on_board(start_square):
-            print("Invalid start square. Start square is out of bounds!\n")
-            return False
-
-        if not self._board.square_on_board(goal_square):
-            print("Goal square is out of bounds! Cannot move chess piece off the board.\n")
-            return False
+        if self._game_state:
+            return MoveError.GAME_OVER
 
-        # Is start_square = goal_square?
-        if start_square[0] == goal_square[0] and start_square[1] == goal_square[1]:
-            print("Moving from a square to itself is an illegal move.\n")
-            return False
+        # Are start_square and goal_square two different squares within the bounds of the game board?
+        if (not self._board.square_on_board(start_square) or not self._board.square_on_board(goal_square)
+                or start_square == goal_square):
+            return MoveError.INVALID_SQUARES
 
         piece_on_start_square = self._board.get_current_piece_on_square(start_square)
         # Does start_square contain a chess piece at all?
         if not piece_on_start_square:
-            print("The specified start square does not contain a chess piece. Move cannot be completed.\n")
-            return False
+            return MoveError.EMPTY_START_SQUARE
 
         # Check if start_square contains a piece from the opposite player
-        if piece_on_start_square.get_color() != self.get_turn_color():
-            print("It's the other player's turn. Move cannot be completed.\n")
-            return False
+        turn_color = self._turn_color
+        if piece_on_start_square.get_color() is not turn_color:
+            return MoveError.WRONG_TURN
 
         # Is the proposed move legal for this type of ChessPiece?
-        if not piece_on_start_square.move_legal(start_square, goal_square, self._board):
-            return False
+        move_error = piece_on_start_square.get_move_error(start_square, goal_square, self._board)
+        if move_error is not None:
+            return move_error
 
         # Does goal_square contain a piece from the current player?
-        piece_on_goal_square = self._board.get_current_piece_on_square(goal_square)
-        if piece_on_goal_square and piece_on_goal_square.get_color() == self.get_turn_color():
-            print("The goal square already contains a piece from the current player. Move cannot be completed.\n")
-            return False
+        if self._board.square_occupied_by(goal_square, turn_color):
+            return MoveError.OWN_PIECE_ON_GOAL
 
         # If we reach this point, the proposed move is legal!
 
         # If there is a piece on goal_square, it must be the opposite player's piece, and will be captured
+        piece_on_goal_square = self._board.get_current_piece_on_square(goal_square)
         if piece_on_goal_square:
-            self._players[piece_on_goal_square.get_color()].add_captured_piece(piece_on_goal_square)
-            print("The current player captured a piece!\n")
-            print("The opposite player's captured pieces are: ", end=' ')
-            for piece in self._players[piece_on_goal_square.get_color()].get_captured_pieces():
-                print(piece.get_label(), end=' ')
-            print('\n')
-
-        # If the captured piece was a king, update the game state
-        if piece_on_goal_square and piece_on_goal_square.get_label() == 'g':
-            self._game_state = GameState.WHITE_WON
-            print("White has captured Black's king! White wins the game!\n")
-        elif piece_on_goal_square and piece_on_goal_square.get_label() == 'G':
-            self._game_state = GameState.BLACK_WON
-            print("Black has captured White's king! Black wins the game!\n")
-
-        # Complete move on the board
-        self._board.update_move(start_square, goal_square, piece_on_start_square)
+            self._opposite_player.add_captured_piece(piece_on_goal_square)
 
-        # If the moved piece was a pawn, and it was the pawn's first turn, flip
-        # the first_move flag
-        if piece_on_start_square.get_label().lower() == 'p':
-            piece_on_start_square.handle_move(start_square, goal_square)
+            # If the captured piece was a king, update the game state
+            captured_label = piece_on_goal_square.get_label()
+            if captured_label == 'g':
+                self._game_state = GameState.WHITE_WON
+            elif captured_label == 'G':
+                self._game_state = GameState.BLACK_WON
 
-        # Print out the updated board and go to next turn
-        self._board.print()
+        # Complete move on the board and go to next turn
+        self._board.update_move(start_square, goal_square, piece_on_start_square)
         self.go_to_next_turn()
+        return None
+
+    def make_move(self, start_square: tuple[int, int], goal_square: tuple[int, int]) -> bool:
+        """
+        Moves a piece from start_square to goal_square.
+        If the game is verbose, prints why an illegal move was rejected, or the captured pieces and the updated board
+        after a legal move.
+        :param start_square: the start position as a tuple (row, column)
+        :param goal_square: the goal position as a tuple (row, column)
+        :return:    Boolean:
+                    False if move is illegal or game has already been won
+                    True if move is legal
+        """
+        # The piece on goal_square is only needed to report a capture
+        piece_on_goal_square = None
+        if self._verbose and self._board.square_on_board(goal_square):
+            piece_on_goal_square = self._board.get_current_piece_on_square(goal_square)
+
+        move_error = self.attempt_move(start_square, goal_square)
+        if move_error is not None:
+            if self._verbose:
+                print(f"{move_error.value}\n")
+            return False
+
+        if self._verbose:
+            if piece_on_goal_square:
+                # The turn has already passed to the opposite player
+                print("The current player captured a piece!\n")
+                print("The opposite player's captured pieces are: ",
+                      self._current_player.get_captured_display(), end='\n\n')
+
+            if self._game_state is GameState.WHITE_WON:
+                print("White has captured Black's king! White wins the game!\n")
+            elif self._game_state is GameState.BLACK_WON:
+                print("Black has captured White's king! Black wins the game!\n")
+
+            # Print out the updated board
+            self._board.print()
         return True
 
-    def enter_fairy_piece(self, piece_type: str, square: np.array) -> bool:
+    def attempt_enter_fairy_piece(self, piece_type: str, square: tuple[int, int]) -> Optional[MoveError]:
         """
-        Enters the specified fairy piece into the game on the specified square.
+        Enters the specified fairy piece into the game on the specified square without printing anything.
         :param piece_type: fairy piece as a char
-        :param square: square to place the piece on as a vector [row, column]
-        :return:    Boolean:
-                    False if the piece is not allowed to enter this square at this turn
-                    True if the piece can enter the specified square legally
+        :param square: square to place the piece on as a tuple (row, column)
+        :return: None if the piece was entered, otherwise the reason why it is not allowed to enter as a MoveError
+                 enumeration member
         """
         square_row = square[0]
 
         # Is the game over?
-        if self._game_state != GameState.UNFINISHED:
-            print("The game is over! No more fairy pieces can be entered!\n")
-            return False
+        if self._game_state:
+            return MoveError.FAIRY_GAME_OVER
 
-        # Obtain the list of fairy pieces available to the current player and count the number of major pieces
+        # Obtain the fairy pieces available to the current player and count the number of major pieces
         # the current player has lost
-        available_fairy_pieces = self._players[self.get_turn_color()].get_fairy_pieces()
-        num_major_pieces = self._players[self.get_turn_color()].count_major_pieces(self._major_pieces)
+        current_player = self._current_player
+        available_fairy_pieces = current_player.get_fairy_pieces()
+        num_major_pieces = current_player.count_major_pieces()
 
         # If this is the first time the current player is trying to enter a fairy piece,
         # but they haven't lost any major pieces yet, we cannot enter the fairy piece
         if len(available_fairy_pieces) == 2 and num_major_pieces == 0:
-            print("This player cannot enter a fairy piece since they have not lost any major pieces yet!\n")
-            return False
+            return MoveError.NO_MAJOR_PIECE_LOST
         elif len(available_fairy_pieces) == 1 and num_major_pieces == 1:
-            print("This player cannot enter a second fairy piece since they have not lost a second major piece yet!\n")
-            return False
-
-        piece_on_square = self._board.get_current_piece_on_square(square)
-        # Does the specified square contain a chess piece already?
-        if piece_on_square:
-            print("The specified square already contains a chess piece. The fairy piece cannot be entered there.\n")
-            return False
-
-        # Checks for white's turn
-        if self.get_turn_color() == Color.WHITE:
-            # Is the square outside of white's home ranks?
-            if square_row < self._board.get_height() - 2:
-                print("White cannot enter a piece outside of row 1 or row 2!\n")
-                return False
-            # Is the specified piece label consistent with being a white chess piece?
-            if piece_type != 'F' and piece_type != 'H':
-                print("White cannot enter a black fairy piece!\n")
-                return False
-        # Checks for black's turn
-        else:
-            # Is the square outside of black's home ranks?
-            if square_row > 1:
-                print("Black cannot enter a piece outside of row 7 or row 8!\n")
-                return False
-            # Is the specified piece label consistent with being a black chess piece?
-            if piece_type != 'f' and piece_type != 'h':
-                print("Black cannot enter a white fairy piece!\n")
-                return False
+            return MoveError.NO_SECOND_MAJOR_PIECE_LOST
+
+        # Is the specified square within the bounds of the game board, and does it contain a chess piece already?
+        if not self._board.square_on_board(square):
+            return MoveError.FAIRY_SQUARE_OFF_BOARD
+        if self._board.square_occupied(square):
+            return MoveError.FAIRY_SQUARE_OCCUPIED
+
+        # Is the square outside of the current player's home ranks, or is the specified piece label not consistent
+        # with being one of the current player's chess pieces?
+        home_rows, labels, outside_home_error, wrong_color_error = FAIRY_ENTRY_RULES[self._turn_color]
+        if square_row not in home_rows:
+            return outside_home_error
+        if piece_type not in labels:
+            return wrong_color_error
 
         # Does the current player have any fairy pieces available?
         if len(available_fairy_pieces) == 0:
-            print("Sorry! This player doesn't have any fairy pieces left!\n")
-            return False
+            return MoveError.NO_FAIRY_PIECES_LEFT
 
         # Is the specified piece available?
-        fairy_piece = None
-        # Search the available fairy pieces for the specified piece
-        for piece in available_fairy_pieces:
-            if piece_type == piece.get_label():
-                fairy_piece = piece
+        fairy_piece = available_fairy_pieces.get(piece_type)
 
         # If we couldn't find the specified piece, it's not available
         if not fairy_piece:
-            print("The current player does not have this type of fairy piece available anymore!\n")
-            return False
+            return MoveError.FAIRY_PIECE_UNAVAILABLE
 
         # If we get through all of the above checks, we can legally enter the fairy piece
 
         # Enter the fairy piece on the board at that position
         self._board.update_piece_entered(square, fairy_piece)
 
-        # Remove the fairy piece from the current player's list of available fairy pieces
-        self._players[self.get_turn_color()].remove_fairy_piece(fairy_piece)
+        # Remove the fairy piece from the current player's available fairy pieces
+        current_player.remove_fairy_piece(fairy_piece)
 
-        # Print out the updated board and go to next turn
-        self._board.print()
+        # Go to next turn
         self.go_to_next_turn()
+        return None
+
+    def enter_fairy_piece(self, piece_type: str, square: tuple[int, int]) -> bool:
+        """
+        Enters the specified fairy piece into the game on the specified square.
+        If the game is verbose, prints why the piece was not allowed to enter, or the updated board after it entered.
+        :param piece_type: fairy piece as a char
+        :param square: square to place the piece on as a tuple (row, column)
+        :return:    Boolean:
+                    False if the piece is not allowed to enter this square at this turn
+                    True if the piece can enter the specified square legally
+        """
+        move_error = self.attempt_enter_fairy_piece(piece_type, square)
+        if move_error is not None:
+            if self._verbose:
+                print(f"{move_error.value}\n")
+            return False
+
+        # Print out the updated board
+        if self._verbose:
+            self._board.print()
         return True
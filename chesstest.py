@@ -1,8 +1,11 @@
 # Test file for chess.py
 
+import copy
+import pickle
 import unittest
 from chess import Chess
 from chess import GameState
+from chess import MoveError
 
 
 class TestChess(unittest.TestCase):
@@ -47,6 +50,45 @@ class TestChess(unittest.TestCase):
         self.assertFalse(self.make_move(game,'g2', 'g9'))  # Attempt to move a piece to a row that isn't on the board
         self.assertFalse(self.make_move(game,'h1', 'g1'))  # Attempt to move a piece to a square that already contains a piece by the current player
 
+    def test_square_conversion(self):
+        """Test converting squares between 'ColRow' strings and (row, column) tuples."""
+        game = Chess(verbose=False)
+        self.assertEqual(game.parse_square('a8'), (0, 0))  # Top left corner
+        self.assertEqual(game.parse_square('h1'), (7, 7))  # Bottom right corner
+        self.assertEqual(game.format_square((7, 0)), 'a1')  # Bottom left corner
+        self.assertEqual(game.format_square((0, 7)), 'h8')  # Top right corner
+        self.assertEqual(game.format_square(game.parse_square('e4')), 'e4')  # Round trip
+        self.assertEqual(game.format_square(game.parse_square('i2')), 'i2')  # Round trip for a square off the board
+
+    def test_move_errors(self):
+        """Test the reasons reported by the silent attempt_move() and attempt_enter_fairy_piece() methods."""
+        game = Chess(verbose=False)
+        self.assertEqual(game.attempt_move(game.parse_square('c3'), game.parse_square('c4')), MoveError.EMPTY_START_SQUARE)  # Empty start square
+        self.assertEqual(game.attempt_move(game.parse_square('f7'), game.parse_square('f5')), MoveError.WRONG_TURN)  # Black piece on white's turn
+        self.assertEqual(game.attempt_move(game.parse_square('g1'), game.parse_square('i2')), MoveError.INVALID_SQUARES)  # Goal square off the board
+        self.assertEqual(game.attempt_move(game.parse_square('e2'), game.parse_square('e5')), MoveError.PAWN_FIRST_MOVE_TOO_FAR)  # Pawn moves 3 squares
+        self.assertEqual(game.attempt_move(game.parse_square('h1'), game.parse_square('g1')), MoveError.OWN_PIECE_ON_GOAL)  # Goal square holds own piece
+        self.assertEqual(game.attempt_enter_fairy_piece('F', game.parse_square('d3')), MoveError.NO_MAJOR_PIECE_LOST)  # No major piece lost yet
+        self.assertIsNone(game.attempt_move(game.parse_square('e2'), game.parse_square('e4')))  # Legal move
+        self.assertEqual(game.get_turn(), 2)  # The legal move passed the turn to black
+
+    def test_copy_game(self):
+        """Test that copied and pickled games can be played independently of the original game."""
+        game = Chess(verbose=False)
+        for start_square, goal_square in (('d2', 'd4'), ('g8', 'f6'), ('c1', 'f4'), ('e7', 'e6'), ('f4', 'c7'),
+                                          ('f6', 'g4'), ('c7', 'b8')):
+            self.assertTrue(self.make_move(game, start_square, goal_square))
+        game_copy = copy.deepcopy(game)
+        self.assertTrue(self.enter_fairy_piece(game_copy, 'f', 'g8'))  # Black enters their falcon in the copy
+        self.assertTrue(self.make_move(game_copy, 'b8', 'a7'))  # White captures a black pawn in the copy
+        self.assertEqual(game.get_turn(), 8)  # The original game is still on black's turn
+        self.assertTrue(self.enter_fairy_piece(game, 'f', 'g8'))  # Black enters their falcon in the original game
+        self.assertTrue(self.make_move(game, 'b8', 'a7'))  # White captures the same black pawn in the original game
+        game_copy = pickle.loads(pickle.dumps(game))
+        self.assertTrue(self.make_move(game_copy, 'a8', 'a7'))  # Black captures a white bishop in the unpickled game
+        self.assertTrue(self.enter_fairy_piece(game_copy, 'F', 'c1'))  # White enters their falcon in the unpickled game
+        self.assertEqual(game.get_turn(), 10)  # The original game is still on black's turn
+
     def test_pawn_movement(self):
         """Test pawn movement."""
         game = Chess()
@@ -253,6 +295,8 @@ class TestChess(unittest.TestCase):
         self.assertFalse(self.enter_fairy_piece(game, 'F', 'd2'))  # White attempts to enter a second falcon fairy piece
         self.assertFalse(self.enter_fairy_piece(game, 'H', 'e1'))  # White attempts to enter their hunter fairy piece on an occupied square
         self.assertFalse(self.enter_fairy_piece(game, 'H','g3'))  # White attempts to enter their hunter fairy piece outside their home ranks
+        self.assertFalse(self.enter_fairy_piece(game, 'H', 'i1'))  # White attempts to enter their hunter fairy piece on a column that isn't on the board
+        self.assertEqual(game.attempt_enter_fairy_piece('H', game.parse_square('i2')), MoveError.FAIRY_SQUARE_OFF_BOARD)  # White attempts to enter their hunter fairy piece on a column that isn't on the board
         self.assertTrue(self.enter_fairy_piece(game, 'H', 'd2'))  # White enters their hunter fairy piece
         self.assertFalse(self.enter_fairy_piece(game, 'h', 'c7'))  # Black attempts to enter another hunter fairy piece
         self.assertFalse(self.make_move(game, 'f7', 'd5'))  # Black attempts to move their hunter fairy piece diagonally forward
@@ -22,34 +22,41 @@
 from chess import Chess
 from chess import GameState
 
+# Instructions printed once at the start of the game, written as a single string so they are printed in one call
+WELCOME_MESSAGE = (
+    "Welcome to falcon-hunter console chess!\n\n"
+    "Please enter squares in the following format: ColumnRow. Examples: a3, f8, h5.\n"
+    "White and black chess pieces are represented by upper-case and lower-case letters respectively "
+    "(for example, 'P' for white pawn and 'b' for black bishop).\n\n"
+    "Each player has two fairy pieces on reserve: one hunter and one falcon.\n"
+    "Hunters move forward like a rook (straight) and backward like a bishop (diagonally).\n"
+    "Falcons move forward like a bishop (diagonally) and backward like a rook (straight).\n"
+    "A player may enter their first fairy piece on any turn after they have lost at least one major piece "
+    "(queen, bishop, knight, or rook).\nA player may enter their second fairy piece on any turn after they have "
+    "lost at least a second major piece.\n"
+    "Fairy pieces may only be entered on a square in one of the player's two home ranks.\n"
+    "Entering a fairy piece counts as the player's full turn.\n"
+    "If you'd like to enter a fairy piece, please do so in the following format:\n"
+    "Enter the type of piece as a letter: f or h for the black falcon or hunter, F or H for the white falcon or "
+    "hunter.\n\n"
+    "Let's begin! White gets to make the first move.\n"
+)
+
+# Announcement for the current player, indexed by the parity of the turn number
+TURN_MESSAGES = ("Black's turn!\n", "White's turn!\n")
+
 
 def main():
-    print("Welcome to falcon-hunter console chess!\n")
-    print("Please enter squares in the following format: ColumnRow. Examples: a3, f8, h5.")
-    print("White and black chess pieces are represented by upper-case and lower-case letters respectively "
-          "(for example, 'P' for white pawn and 'b' for black bishop).\n")
-    print("Each player has two fairy pieces on reserve: one hunter and one falcon.")
-    print("Hunters move forward like a rook (straight) and backward like a bishop (diagonally).")
-    print("Falcons move forward like a bishop (diagonally) and backward like a rook (straight).")
-    print("A player may enter their first fairy piece on any turn after they have lost at least one major piece "
-          "(queen, bishop, knight, or rook).\nA player may enter their second fairy piece on any turn after they have "
-          "lost at least a second major piece.")
-    print("Fairy pieces may only be entered on a square in one of the player's two home ranks.")
-    print("Entering a fairy piece counts as the player's full turn.")
-    print("If you'd like to enter a fairy piece, please do so in the following format:\n"
-          "Enter the type of piece as a letter: f or h for the black falcon or hunter, F or H for the white falcon or "
-          "hunter.\n")
-    print("Let's begin! White gets to make the first move.\n")
+    print(WELCOME_MESSAGE)
 
     game = Chess()
     game.print_board()
 
-    while game.get_game_state() == GameState.UNFINISHED:
-        # Print current player
-        if game.get_turn() % 2 == 1:
-            print("White's turn!\n")
-        else:
-            print("Black's turn!\n")
+    # Only a move can end the game, so the state is re-read after each move instead of on every check
+    game_state = game.get_game_state()
+    while game_state is GameState.UNFINISHED:
+        # Print current player, odd turns belong to white
+        print(TURN_MESSAGES[game.get_turn() % 2])
 
         entering_fairy_piece = input("Would you like to enter a fairy piece? (y/n): ")
         # TODO: Check if player can enter a piece before asking other questions
@@ -69,8 +76,9 @@ def main():
         goal_square = game.parse_square(goal_square)
 
         game.make_move(start_square, goal_square)
+        game_state = game.get_game_state()
 
-    if game.get_game_state() == GameState.BLACK_WON:
+    if game_state is GameState.BLACK_WON:
         winner = "Black"
     else:
         winner = "White"